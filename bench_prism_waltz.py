@@ -0,0 +1,96 @@
+"""Benchmarks for the Dreamer Waltz engine.
+
+Run `python bench_prism_waltz.py` (add `--quick` for fewer repeats).
+Each benchmark prints one line; cold start figures are measured in fresh
+interpreters, because that's what sim workers pay.
+"""
+import contextlib
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, HERE)
+
+
+def _run_cold(code, repeats, env=None):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=HERE, env=env, check=True)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def bench_cold_start(repeats):
+    """Fresh-interpreter import costs, net of bare interpreter startup."""
+    bare = _run_cold("pass", repeats)
+    engine = _run_cold("import prism_waltz_tr", repeats)
+    roster = _run_cold("import prism_waltz_tr as pw; pw.ROSTER.echo_lib; pw.ROSTER.houses", repeats)
+
+    # Cache miss: point the registry at an empty cache dir every run
+    miss_code = (
+        "import sys, tempfile, prism_waltz_tr as pw\n"
+        "pw.ROSTER = pw.RosterRegistry(cache_dir=tempfile.mkdtemp())\n"
+        "pw.ROSTER.echo_lib\n"
+    )
+    miss = _run_cold(miss_code, repeats)
+
+    report("cold start: interpreter", bare * 1000, "ms")
+    report("cold start: engine import only", (engine - bare) * 1000, "ms")
+    report("cold start: engine + cached roster", (roster - bare) * 1000, "ms")
+    report("cold start: engine + roster compile", (miss - bare) * 1000, "ms")
+
+
+def bench_duels(n):
+    """AI vs AI duels per second, console output discarded."""
+    import prism_waltz_tr as pw
+
+    rng = random.Random(1234)
+    pool = [dict(c, house=h) for h, cs in pw.ROSTER.houses.items() for c in cs]
+    matchups = [(rng.sample(pool, 5), rng.sample(pool, 5)) for _ in range(n)]
+
+    random.seed(1234)
+    with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink):
+        start = time.perf_counter()
+        for a, b in matchups:
+            pw.battle_history.clear()
+            pw.duel([pw.Champion(c) for c in a], [pw.Champion(c) for c in b], False, False)
+        elapsed = time.perf_counter() - start
+    report("duel throughput (AI vs AI)", n / elapsed, "duels/s")
+
+
+def bench_headless_duels(n, crn=False):
+    """AI vs AI duels per second through the headless sim path."""
+    import prism_waltz_tr as pw
+    import prism_waltz_sim as sim
+
+    label = f"duel throughput (headless{', crn' if crn else ''})"
+    rng = random.Random(1234)
+    names = [c["name"] for c in pw.ROSTER.snapshot().champions]
+    matchups = [(rng.sample(names, 5), rng.sample(names, 5)) for _ in range(n)]
+
+    start = time.perf_counter()
+    for i, (a, b) in enumerate(matchups):
+        sim.simulate(a, b, seed=i, crn=crn)
+    elapsed = time.perf_counter() - start
+    report(label, n / elapsed, "duels/s")
+
+
+def report(name, value, unit):
+    print(f"{name:<40} {value:>10.2f} {unit}")
+
+
+def main():
+    quick = "--quick" in sys.argv
+    bench_cold_start(3 if quick else 10)
+    bench_duels(50 if quick else 500)
+    for crn in (False, True):
+        bench_headless_duels(200 if quick else 2000, crn)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,538 @@
+"""Headless simulation tools for Dreamer Waltz: Timeline Rupture.
+
+Battles here run silently (see prism_waltz_tr.headless) against one
+RosterSnapshot, and every result is the dict returned by
+prism_waltz_tr.duel. Teams are given as tuples of champion names.
+"""
+import hashlib
+import itertools
+import json
+import math
+import os
+import sqlite3
+import time
+import zlib
+
+import prism_waltz_tr as pw
+
+RESULT_CACHE_PATH = os.path.join(pw.BASE_DIR, ".prism_cache", "results.sqlite")
+
+
+TEAM_KEY_BITS = 16  # bits per champion slot in a packed team key
+
+
+def team_key(ids):
+    """Order-independent int key for a team: sorted champion ids packed
+    TEAM_KEY_BITS apart. Ids are stored +1 so teams of different sizes
+    never collide."""
+    key = 0
+    for champ_id in sorted(ids):
+        key = (key << TEAM_KEY_BITS) | (champ_id + 1)
+    return key
+
+
+def unpack_team_key(key):
+    mask = (1 << TEAM_KEY_BITS) - 1
+    ids = []
+    while key:
+        ids.append((key & mask) - 1)
+        key >>= TEAM_KEY_BITS
+    return ids[::-1]
+
+
+def matchup_key(ids_a, ids_b, symmetric=None):
+    """(key, swapped) for a matchup. When the engine treats both sides
+    alike (pw.SIDE_SYMMETRIC), A-vs-B and B-vs-A share one key and
+    `swapped` says the caller's team A sits second in it."""
+    symmetric = pw.SIDE_SYMMETRIC if symmetric is None else symmetric
+    key_a, key_b = team_key(ids_a), team_key(ids_b)
+    if symmetric and key_b < key_a:
+        return (key_b, key_a), True
+    return (key_a, key_b), False
+
+
+def canonical_teams(ids, size=5):
+    """Every distinct team from `ids`, each once (no reorderings)."""
+    return itertools.combinations(sorted(ids), size)
+
+
+def canonical_names(names, roster):
+    """Team names in canonical (champion id) order."""
+    return tuple(sorted(names, key=lambda name: roster.by_name[name]["id"]))
+
+
+def score(result, side=0):
+    """1 for a win by `side`, 0.5 for a draw, 0 for a loss."""
+    return pw.side_score(result["winner"], side)
+
+
+def build_team(names, roster, rules=None):
+    # Canonical order, so [A,B,C,D,E] and [E,D,C,B,A] fight identical battles
+    return [pw.Champion(roster.by_name[name], roster, rules) for name in canonical_names(names, roster)]
+
+
+def battle_seed(base_seed, team_a, team_b, index):
+    """Stable per-battle seed (str hash() is salted per process)."""
+    return zlib.crc32(f"{base_seed}|{'/'.join(team_a)}|{'/'.join(team_b)}|{index}".encode())
+
+
+class ResultCache:
+    """Content-addressed store of headless duel results, on disk.
+
+    Keys hash (team A ids, team B ids, seed, ruleset hash, engine version);
+    the ruleset hash is the matchup's content_key, so a roster edit only
+    misses for matchups that depend on it. The store keeps a byte budget:
+    triggers keep a running total of row sizes in the meta table, put()
+    evicts least-recently-used rows once it passes `max_bytes`, and
+    compact() hands the freed pages back to the file system. Hits only
+    bump last_used in memory; the touches are written in batches of
+    `touch_batch` (and before any eviction or close()).
+    """
+    def __init__(self, path=None, max_bytes=256 * 1024 * 1024, touch_batch=512):
+        self.path = path or RESULT_CACHE_PATH
+        self.max_bytes = max_bytes
+        self.touch_batch = touch_batch
+        self.touched = {}  # key -> last_used not yet written
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self.db = sqlite3.connect(self.path, timeout=30)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.executescript("""
+            CREATE TABLE IF NOT EXISTS results (
+                key TEXT PRIMARY KEY, value TEXT NOT NULL,
+                size INTEGER NOT NULL, last_used REAL NOT NULL);
+            CREATE INDEX IF NOT EXISTS results_lru ON results (last_used);
+            CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value INTEGER NOT NULL);
+            INSERT OR IGNORE INTO meta (name, value)
+                SELECT 'bytes', COALESCE(SUM(size), 0) FROM results;
+            CREATE TRIGGER IF NOT EXISTS results_bytes_insert AFTER INSERT ON results
+                BEGIN UPDATE meta SET value = value + NEW.size WHERE name = 'bytes'; END;
+            CREATE TRIGGER IF NOT EXISTS results_bytes_update AFTER UPDATE OF size ON results
+                BEGIN UPDATE meta SET value = value + NEW.size - OLD.size WHERE name = 'bytes'; END;
+            CREATE TRIGGER IF NOT EXISTS results_bytes_delete AFTER DELETE ON results
+                BEGIN UPDATE meta SET value = value - OLD.size WHERE name = 'bytes'; END;
+        """)
+        self.db.commit()
+        self.hits = self.misses = 0
+
+    @staticmethod
+    def key(team_a, team_b, seed, ruleset_hash, engine_version=None):
+        """`team_a` / `team_b` are team_key() ints (or id lists)."""
+        if not isinstance(team_a, int):
+            team_a, team_b = team_key(team_a), team_key(team_b)
+        parts = (str(team_a), str(team_b), str(seed), ruleset_hash, engine_version or pw.ENGINE_VERSION)
+        return hashlib.sha256("|".join(parts).encode()).hexdigest()
+
+    def get(self, key):
+        row = self.db.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.touched[key] = time.time()
+        if len(self.touched) >= self.touch_batch:
+            self.flush()
+        return json.loads(row[0])
+
+    def flush(self):
+        """Write pending last_used updates."""
+        if self.touched:
+            self.db.executemany(
+                "UPDATE results SET last_used = ? WHERE key = ?",
+                [(used, key) for key, used in self.touched.items()],
+            )
+            self.db.commit()
+            self.touched = {}
+
+    def put(self, key, result):
+        value = json.dumps(result, separators=(",", ":"))
+        # An upsert, not INSERT OR REPLACE: REPLACE's implicit delete
+        # doesn't fire the byte-count trigger
+        self.db.execute(
+            "INSERT INTO results (key, value, size, last_used) VALUES (?, ?, ?, ?)"
+            " ON CONFLICT (key) DO UPDATE SET value = excluded.value,"
+            " size = excluded.size, last_used = excluded.last_used",
+            (key, value, len(key) + len(value), time.time()),
+        )
+        self.db.commit()
+        if self.size() > self.max_bytes:
+            self.evict()
+
+    def size(self):
+        """Bytes of keys and values stored (the running total)."""
+        return self.db.execute("SELECT value FROM meta WHERE name = 'bytes'").fetchone()[0]
+
+    def evict(self):
+        """Drop least-recently-used rows until under 90% of max_bytes."""
+        total = self.size()
+        if total <= self.max_bytes:
+            return 0
+        self.flush()
+        target = total - int(self.max_bytes * 0.9)
+        freed = 0
+        rows = self.db.execute("SELECT key, size FROM results ORDER BY last_used")
+        doomed = []
+        for key, size in rows:
+            if freed >= target:
+                break
+            doomed.append((key,))
+            freed += size
+        self.db.executemany("DELETE FROM results WHERE key = ?", doomed)
+        self.db.commit()
+        return len(doomed)
+
+    def compact(self):
+        """Evict past the cap, then rebuild the file to reclaim free pages."""
+        self.flush()
+        self.evict()
+        self.db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        self.db.execute("VACUUM")
+
+    def close(self):
+        self.flush()
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def simulate(team_a, team_b, seed, roster=None, cache=None, rules=None, crn=False):
+    """One silent AI vs AI duel; team_a fights as the Dreamers, under
+    `rules` (default: the context's Ruleset). With a ResultCache, a
+    previously simulated identical battle is reused. Combat rolls come
+    from a pw.Dice seeded with `seed`; crn=True gives every champion its
+    own streams (see paired())."""
+    roster = roster or pw.ROSTER.snapshot()
+    champs_a, champs_b = build_team(team_a, roster, rules), build_team(team_b, roster, rules)
+    key = None
+    if cache is not None:
+        (key_a, key_b), _ = matchup_key(
+            [c["id"] for c in map(roster.by_name.get, team_a)],
+            [c["id"] for c in map(roster.by_name.get, team_b)],
+            symmetric=False,
+        )
+        ruleset_hash = "|".join((
+            roster.content_key(champs_a + champs_b), champs_a[0].rules.digest,
+            "crn" if crn else "",
+        ))
+        key = cache.key(key_a, key_b, seed, ruleset_hash)
+        result = cache.get(key)
+        if result is not None:
+            return result
+    with pw.headless(), pw.use_dice(pw.Dice(seed, paired=crn)):
+        result = pw.duel(champs_a, champs_b, False, False)
+    if cache is not None:
+        cache.put(key, result)
+    return result
+
+
+# --- Paired simulations ---
+
+def paired(variant_a, variant_b, battles=200, seed=0):
+    """Compare two variants battle by battle with common random numbers.
+
+    Each variant is a dict of simulate() arguments: team_a, team_b and
+    optionally roster and rules — e.g. the same teams under two rulesets,
+    or one matchup before and after a balance change. Battle i of both
+    variants uses the same seed and per-champion dice, so their score
+    difference is mostly the change itself. Returns the mean score
+    difference (A - B, team_a's view) with its paired standard error and,
+    for comparison, the standard error independent runs would have had.
+    """
+    diffs, scores_a, scores_b = [], [], []
+    for i in range(battles):
+        battle = battle_seed(seed, (), (), i)
+        a = score(simulate(seed=battle, crn=True, **variant_a))
+        b = score(simulate(seed=battle, crn=True, **variant_b))
+        scores_a.append(a)
+        scores_b.append(b)
+        diffs.append(a - b)
+
+    def variance(xs):
+        mean = sum(xs) / len(xs)
+        return sum((x - mean) ** 2 for x in xs) / max(len(xs) - 1, 1)
+
+    n = len(diffs)
+    return {
+        "battles": n,
+        "win_rate_a": sum(scores_a) / n,
+        "win_rate_b": sum(scores_b) / n,
+        "difference": sum(diffs) / n,
+        "stderr": math.sqrt(variance(diffs) / n),
+        "stderr_unpaired": math.sqrt((variance(scores_a) + variance(scores_b)) / n),
+    }
+
+
+# --- Sequential stopping ---
+# A stop rule is called as rule(wins, battles) after every battle of a
+# matchup and returns True once the estimate is good enough. wins may be
+# fractional (draws score half).
+
+def wilson_interval(wins, n, z=1.96):
+    """Wilson score interval for a win rate of wins / n."""
+    if not n:
+        return 0.0, 1.0
+    p = wins / n
+    denom = 1 + z * z / n
+    centre = (p + z * z / (2 * n)) / denom
+    half = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denom
+    return max(centre - half, 0.0), min(centre + half, 1.0)
+
+
+class WilsonStop:
+    """Stop once the Wilson interval is no wider than ±half_width."""
+    def __init__(self, half_width=0.05, z=1.96, min_battles=20):
+        self.half_width = half_width
+        self.z = z
+        self.min_battles = min_battles
+
+    def __call__(self, wins, n):
+        if n < self.min_battles:
+            return False
+        low, high = wilson_interval(wins, n, self.z)
+        return (high - low) / 2 <= self.half_width
+
+
+class SPRTStop:
+    """Wald's sequential probability ratio test, two-sided around 50%:
+    is the matchup fair (p = 0.5) or lopsided by at least `delta`?
+
+    Runs one test per direction (0.5 vs 0.5 + delta, 0.5 vs 0.5 - delta)
+    with error rates alpha / beta. It stops as soon as either test accepts
+    its lopsided alternative ("favoured" / "unfavoured"); "fair" needs
+    both tests to accept p = 0.5. decision() reports the verdict.
+    """
+    def __init__(self, delta=0.05, alpha=0.05, beta=0.05, min_battles=10):
+        self.delta = delta
+        self.min_battles = min_battles
+        self.upper = math.log((1 - beta) / alpha)
+        self.lower = math.log(beta / (1 - alpha))
+
+    def _llr(self, wins, n, p1):
+        return wins * math.log(p1 / 0.5) + (n - wins) * math.log((1 - p1) / 0.5)
+
+    def decision(self, wins, n):
+        """"favoured" / "unfavoured" (for team A), "fair", or None while
+        the evidence is still inconclusive."""
+        if n < self.min_battles:
+            return None
+        up = self._llr(wins, n, 0.5 + self.delta)
+        down = self._llr(wins, n, 0.5 - self.delta)
+        if up >= self.upper:
+            return "favoured"
+        if down >= self.upper:
+            return "unfavoured"
+        if up <= self.lower and down <= self.lower:
+            return "fair"
+        return None
+
+    def __call__(self, wins, n):
+        return self.decision(wins, n) is not None
+
+
+class MatchupMatrix:
+    """Win rates for a set of matchups, re-simulating only what changed.
+
+    A reverse index maps each champion to the matchups it appears in.
+    After a roster reload, update_roster() asks the snapshots which
+    champions depend on the changed echoes / house bonuses / champions and
+    drops just those matchups' results; run() then fills the gaps.
+    Every battle run is also handed to `sink` — one object or a list,
+    e.g. a prism_waltz_store.ResultWarehouse or a
+    prism_waltz_stats.ChampionStats — via sink.add(result, seed).
+    With a `stop` rule (WilsonStop, SPRTStop) each matchup ends as soon
+    as its estimate is precise enough, `battles` being the cap.
+    """
+    def __init__(self, roster=None, battles=100, seed=0, cache=None, sink=None, stop=None):
+        self.roster = roster or pw.ROSTER.snapshot()
+        self.battles = battles
+        self.seed = seed
+        self.cache = cache
+        self.stop = stop  # WilsonStop / SPRTStop; `battles` is then the maximum
+        if sink is None:
+            sink = ()
+        self.sinks = tuple(sink) if isinstance(sink, (list, tuple)) else (sink,)
+        self.matchups = {}     # key -> (team_a, team_b)
+        self.results = {}      # key -> summary dict
+        self.by_champion = {}  # champion name -> set of keys
+
+    def _key(self, team_a, team_b):
+        """Canonical (key, swapped) for a matchup given by names."""
+        a = canonical_names(team_a, self.roster)
+        b = canonical_names(team_b, self.roster)
+        if pw.SIDE_SYMMETRIC and b < a:
+            return (b, a), True
+        return (a, b), False
+
+    def add(self, team_a, team_b):
+        key, _ = self._key(team_a, team_b)
+        if key not in self.matchups:
+            self.matchups[key] = key
+            for name in key[0] + key[1]:
+                self.by_champion.setdefault(name, set()).add(key)
+        return key
+
+    def win_rate(self, team_a, team_b):
+        """team_a's win rate against team_b, or None if not simulated yet."""
+        key, swapped = self._key(team_a, team_b)
+        summary = self.results.get(key)
+        if summary is None:
+            return None
+        return 1 - summary["win_rate_a"] if swapped else summary["win_rate_a"]
+
+    def stale(self):
+        return [key for key in self.matchups if key not in self.results]
+
+    def run(self):
+        """Simulate every matchup without a current result; returns how many ran."""
+        stale = self.stale()
+        for key in stale:
+            team_a, team_b = key
+            wins_a = rounds = battles = 0
+            content_key = None
+            while battles < self.battles:
+                seed = battle_seed(self.seed, team_a, team_b, battles)
+                result = simulate(team_a, team_b, seed, self.roster, self.cache)
+                for sink in self.sinks:
+                    sink.add(result, seed)
+                wins_a += score(result)
+                rounds += result["rounds"]
+                content_key = result["content_key"]
+                battles += 1
+                if self.stop is not None and self.stop(wins_a, battles):
+                    break
+            self.results[key] = {
+                "wins_a": wins_a,
+                "battles": battles,
+                "win_rate_a": wins_a / battles,
+                "interval": wilson_interval(wins_a, battles),
+                "avg_rounds": rounds / battles,
+                "content_key": content_key,
+            }
+        for sink in self.sinks:
+            flush = getattr(sink, "flush", None)
+            if flush is not None:
+                flush()
+        return len(stale)
+
+    def invalidate(self, champion_names):
+        """Drop results for every matchup featuring one of these champions."""
+        keys = set()
+        for name in champion_names:
+            keys |= self.by_champion.get(name, set())
+        for key in keys:
+            self.results.pop(key, None)
+        return keys
+
+    def update_roster(self, snapshot=None):
+        """Switch to a newer snapshot, invalidating only affected matchups.
+        Matchups with champions that no longer exist are removed."""
+        snapshot = snapshot or pw.ROSTER.snapshot()
+        if snapshot is self.roster:
+            return set()
+        changes = snapshot.diff(self.roster)
+        affected = snapshot.index.dependents(**changes) | self.roster.index.dependents(**changes)
+        invalidated = self.invalidate(affected)
+
+        for name in changes["champions"] - set(snapshot.by_name):
+            for key in self.by_champion.pop(name, set()):
+                self.matchups.pop(key, None)
+                for other in key[0] + key[1]:
+                    self.by_champion.get(other, set()).discard(key)
+        self.roster = snapshot
+        return invalidated
+
+
+# --- Process-pool runner ---
+# Jobs name their roster as overrides on a base snapshot (see
+# RosterSnapshot.with_changes) instead of shipping snapshots between
+# processes; each worker gets the pool's base roster once, as plain
+# tables, and keeps the few variants it built last.
+_BASE_ROSTER = None
+_VARIANTS = {}
+_VARIANT_SLOTS = 8
+
+
+def _init_worker(tables):
+    global _BASE_ROSTER
+    _BASE_ROSTER = pw.RosterSnapshot(*tables) if tables is not None else None
+
+
+def _variant_roster(overrides, base=None):
+    base = base or _BASE_ROSTER or pw.ROSTER.snapshot()
+    if not overrides:
+        return base
+    key = (base.version, json.dumps(overrides, sort_keys=True))
+    roster = _VARIANTS.get(key)
+    if roster is None:
+        if len(_VARIANTS) >= _VARIANT_SLOTS:
+            _VARIANTS.pop(next(iter(_VARIANTS)))
+        roster = _VARIANTS[key] = base.with_changes(**overrides)
+    return roster
+
+
+def _run_chunk(overrides, battles, crn=False, base=None):
+    overrides = dict(overrides or {})
+    rules = pw.DEFAULT_RULES.replace(**overrides.pop("rules", None) or {})
+    roster = _variant_roster(overrides, base)
+    return [
+        simulate(team_a, team_b, seed, roster, rules=rules, crn=crn)
+        for team_a, team_b, seed in battles
+    ]
+
+
+class SimPool:
+    """Runs batches of headless duels on a process pool.
+
+    A battle is (team_a names, team_b names, seed); `overrides` is None or
+    a dict of RosterSnapshot.with_changes() arguments, plus optionally
+    "rules": {Ruleset field: value} (e.g. {"hp_bonus": 60}), so
+    variants can be evaluated without touching the packs. Overrides apply
+    to `roster` (default: each worker's live roster), which is sent to the
+    workers once when the pool starts. Give every variant the same battle
+    list for common random numbers; with crn=True (the default) battles
+    also roll on per-champion dice, so the variants stay in step even after
+    their battles diverge. workers=0 runs everything in this process.
+    """
+    def __init__(self, workers=None, chunk_size=50, crn=True, roster=None):
+        self.workers = os.cpu_count() if workers is None else workers
+        self.chunk_size = chunk_size
+        self.crn = crn
+        self.roster = roster
+        self.executor = None
+        if self.workers:
+            from concurrent.futures import ProcessPoolExecutor
+            tables = roster.tables() if roster is not None else None
+            self.executor = ProcessPoolExecutor(self.workers, initializer=_init_worker, initargs=(tables,))
+
+    def run(self, jobs):
+        """`jobs` is a list of (overrides, battles); returns one result
+        list per job, in battle order. All jobs share the pool at once."""
+        jobs = list(jobs)
+        if self.executor is None:
+            return [
+                _run_chunk(overrides, battles, self.crn, self.roster)
+                for overrides, battles in jobs
+            ]
+        futures = []
+        for overrides, battles in jobs:
+            futures.append([
+                self.executor.submit(_run_chunk, overrides, battles[i:i + self.chunk_size], self.crn)
+                for i in range(0, len(battles), self.chunk_size)
+            ])
+        return [[result for future in chunks for result in future.result()] for chunks in futures]
+
+    def map(self, battles, overrides=None):
+        return self.run([(overrides, battles)])[0]
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
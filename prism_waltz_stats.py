@@ -0,0 +1,241 @@
+"""Streaming statistics over Dreamer Waltz simulations.
+
+Nothing here keeps individual battles: every figure is an online
+accumulator updated once per champion per battle, so memory stays
+constant no matter how many duels are fed in. Accumulators from
+separate worker processes pickle cleanly and combine with merge().
+"""
+import prism_waltz_tr as pw
+
+# Per-champion metrics taken from duel() results, with histogram bin widths
+CHAMPION_METRICS = {
+    "damage_dealt": 25,
+    "damage_taken": 25,
+    "healing_done": 10,
+    "ep_spent": 10,
+    "turns_survived": 1,
+    "kos": 1,
+}
+
+
+class RunningStat:
+    """Count, mean, variance (Welford), min, max and a fixed-width
+    histogram of a stream of numbers. Histogram bins are sparse
+    ({bin index: count}), so only observed ranges cost memory."""
+    __slots__ = ("bin_width", "n", "mean", "m2", "min", "max", "bins")
+
+    def __init__(self, bin_width=1):
+        self.bin_width = bin_width
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = None
+        self.max = None
+        self.bins = {}
+
+    def add(self, x):
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (x - self.mean)
+        if self.min is None or x < self.min:
+            self.min = x
+        if self.max is None or x > self.max:
+            self.max = x
+        b = int(x // self.bin_width)
+        self.bins[b] = self.bins.get(b, 0) + 1
+
+    def merge(self, other):
+        """Fold another accumulator of the same metric into this one
+        (Chan et al.'s pairwise update); returns self."""
+        if not other.n:
+            return self
+        if not self.n:
+            self.n, self.mean, self.m2 = other.n, other.mean, other.m2
+            self.min, self.max, self.bins = other.min, other.max, dict(other.bins)
+            return self
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        self.mean += delta * other.n / n
+        self.m2 += other.m2 + delta * delta * self.n * other.n / n
+        self.n = n
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        for b, count in other.bins.items():
+            self.bins[b] = self.bins.get(b, 0) + count
+        return self
+
+    @property
+    def variance(self):
+        return self.m2 / (self.n - 1) if self.n > 1 else 0.0
+
+    @property
+    def stdev(self):
+        return self.variance ** 0.5
+
+    def histogram(self):
+        """[(bin start, count)] in ascending order."""
+        return [(b * self.bin_width, self.bins[b]) for b in sorted(self.bins)]
+
+    def quantile(self, q):
+        """Approximate quantile: the start of the bin holding it."""
+        if not self.n:
+            return None
+        rank = q * (self.n - 1)
+        seen = 0
+        for b in sorted(self.bins):
+            seen += self.bins[b]
+            if seen > rank:
+                return b * self.bin_width
+        return self.max
+
+    def __getstate__(self):
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    def __setstate__(self, state):
+        for slot, value in state.items():
+            setattr(self, slot, value)
+
+    def __repr__(self):
+        return f"RunningStat(n={self.n}, mean={self.mean:.2f}, sd={self.stdev:.2f}, min={self.min}, max={self.max})"
+
+
+class ChampionStats:
+    """Per-champion RunningStats for every CHAMPION_METRICS entry, plus
+    wins (draws count half, as in prism_waltz_sim.score). Use as a MatchupMatrix sink, or call add() with each
+    duel() result; the engine tallies the metrics as damage, healing and
+    EP flow through the battle, so this only reads the final figures."""
+    def __init__(self, metrics=None):
+        self.metrics = dict(metrics or CHAMPION_METRICS)
+        self.champions = {}  # name -> {metric: RunningStat}
+        self.wins = {}       # name -> battles won, draws counting half
+        self.battles = 0
+
+    def _stats(self, name):
+        stats = self.champions.get(name)
+        if stats is None:
+            stats = self.champions[name] = {
+                metric: RunningStat(width) for metric, width in self.metrics.items()
+            }
+        return stats
+
+    def add(self, result, seed=None):
+        self.battles += 1
+        winner = result["winner"]
+        for champ in result["champions"]:
+            name = champ["name"]
+            stats = self._stats(name)
+            for metric in self.metrics:
+                stats[metric].add(champ[metric])
+            self.wins[name] = self.wins.get(name, 0) + pw.side_score(winner, champ["side"])
+
+    def merge(self, other):
+        """Fold in another worker's ChampionStats; returns self."""
+        self.battles += other.battles
+        for name, stats in other.champions.items():
+            mine = self._stats(name)
+            for metric, stat in stats.items():
+                mine[metric].merge(stat)
+        for name, wins in other.wins.items():
+            self.wins[name] = self.wins.get(name, 0) + wins
+        return self
+
+    @classmethod
+    def merged(cls, parts):
+        total = cls()
+        for part in parts:
+            total.merge(part)
+        return total
+
+    def report(self, sort_by="damage_dealt", min_battles=1):
+        """One row per champion, highest mean `sort_by` first (or highest
+        win rate with sort_by="win_rate")."""
+        rows = []
+        for name, stats in self.champions.items():
+            n = next(iter(stats.values())).n
+            if n < min_battles:
+                continue
+            row = {"name": name, "battles": n, "win_rate": self.wins.get(name, 0) / n}
+            for metric, stat in stats.items():
+                row[metric] = stat.mean
+                row[metric + "_sd"] = stat.stdev
+            rows.append(row)
+        rows.sort(key=lambda row: row[sort_by], reverse=True)
+        return rows
+
+
+class EchoStats:
+    """Per-echo usage and value, summed over battles: casts, damage and
+    healing done (regen / DOT ticks included) and statuses applied by the
+    echo itself, and how often the caster's team won when it was cast
+    (draws count half). Plain counters, so merging worker results is just
+    addition. Use as a MatchupMatrix sink or feed add() with duel()
+    results."""
+    FIELDS = ("battles", "wins", "casts", "damage", "healing", "statuses")
+
+    def __init__(self):
+        self.echoes = {}  # title -> [battles, wins, casts, damage, healing, statuses]
+        self.battles = 0
+
+    def add(self, result, seed=None):
+        self.battles += 1
+        winner = result["winner"]
+        for champ in result["champions"]:
+            won = pw.side_score(winner, champ["side"])
+            value = champ["echo_value"]
+            for title, casts in champ["echo_casts"].items():
+                row = self.echoes.get(title)
+                if row is None:
+                    row = self.echoes[title] = [0] * len(self.FIELDS)
+                damage, healing, statuses = value.get(title, (0, 0, 0))
+                row[0] += 1
+                row[1] += won
+                row[2] += casts
+                row[3] += damage
+                row[4] += healing
+                row[5] += statuses
+
+    def merge(self, other):
+        """Fold in another worker's EchoStats; returns self."""
+        self.battles += other.battles
+        for title, theirs in other.echoes.items():
+            row = self.echoes.get(title)
+            if row is None:
+                self.echoes[title] = list(theirs)
+            else:
+                for i, count in enumerate(theirs):
+                    row[i] += count
+        return self
+
+    @classmethod
+    def merged(cls, parts):
+        total = cls()
+        for part in parts:
+            total.merge(part)
+        return total
+
+    def report(self, roster=None, sort_by="win_rate", min_battles=1):
+        """Ranked rows, best `sort_by` first: win_rate (when cast),
+        casts, or damage / healing / statuses per cast. With a roster,
+        echoes that were never cast are appended last with zero counts,
+        so dead echoes show up too."""
+        rows = []
+        for title, (battles, wins, casts, damage, healing, statuses) in self.echoes.items():
+            if battles < min_battles:
+                continue
+            rows.append({
+                "title": title,
+                "battles": battles,
+                "win_rate": wins / battles,
+                "casts": casts,
+                "damage": damage / casts,
+                "healing": healing / casts,
+                "statuses": statuses / casts,
+            })
+        rows.sort(key=lambda row: row[sort_by], reverse=True)
+        if roster is not None:
+            for title in roster.echo_lib:
+                if title not in self.echoes:
+                    rows.append({"title": title, "battles": 0, "win_rate": None, "casts": 0,
+                                 "damage": 0, "healing": 0, "statuses": 0})
+        return rows
@@ -0,0 +1,403 @@
+"""Result storage for Dreamer Waltz simulations.
+
+ResultWarehouse keeps every simulated battle in SQLite for later
+analysis: one row per battle, one per champion who fought in it and one
+per echo a champion cast. Rows are buffered and written in batched
+transactions, so a tournament run can feed it tens of thousands of
+battles per second.
+
+ResultColumns is the bulk format for very large runs: fixed-width
+columns in flat binary files that only ever grow, read back through
+NumPy memmaps so aggregations stream from disk instead of RAM.
+"""
+import array
+import json
+import os
+import sqlite3
+
+import prism_waltz_tr as pw
+
+WAREHOUSE_PATH = os.path.join(pw.BASE_DIR, ".prism_cache", "warehouse.sqlite")
+
+SIDES = pw.SIDES
+
+WAREHOUSE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS battles (
+    id INTEGER PRIMARY KEY,
+    seed INTEGER,
+    team_a TEXT NOT NULL,
+    team_b TEXT NOT NULL,
+    winner_side INTEGER,
+    rounds INTEGER NOT NULL,
+    roster_version TEXT,
+    content_key TEXT,
+    engine_version TEXT
+);
+CREATE TABLE IF NOT EXISTS battle_champions (
+    battle_id INTEGER NOT NULL,
+    side INTEGER NOT NULL,
+    slot INTEGER NOT NULL,
+    champion TEXT NOT NULL,
+    house TEXT,
+    won REAL NOT NULL,  -- 1 win, 0.5 draw, 0 loss (prism_waltz_sim.score)
+    alive INTEGER NOT NULL,
+    damage_dealt INTEGER NOT NULL,
+    damage_taken INTEGER NOT NULL,
+    kos INTEGER NOT NULL,
+    echo_casts INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS battle_echoes (
+    battle_id INTEGER NOT NULL,
+    side INTEGER NOT NULL,
+    champion TEXT NOT NULL,
+    echo TEXT NOT NULL,
+    casts INTEGER NOT NULL,
+    won REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS battle_champions_champion ON battle_champions (champion);
+CREATE INDEX IF NOT EXISTS battle_champions_house ON battle_champions (house);
+CREATE INDEX IF NOT EXISTS battle_echoes_echo ON battle_echoes (echo);
+"""
+
+
+class ResultWarehouse:
+    """Battle results in SQLite, bulk-ingested.
+
+    add() only buffers; every `batch_size` battles (and on flush() /
+    close()) the buffer is written in one transaction with executemany.
+    The database runs in WAL mode, so readers — and other worker
+    processes with their own warehouse on the same file — don't block
+    ingestion. Battle ids are assigned at flush time.
+    """
+    def __init__(self, path=None, batch_size=1000):
+        self.path = path or WAREHOUSE_PATH
+        self.batch_size = batch_size
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self.db = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(WAREHOUSE_SCHEMA)
+        self.pending = []  # (seed, result)
+
+    def add(self, result, seed=None):
+        """Queue one duel() result dict."""
+        self.pending.append((seed, result))
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def ingest(self, results):
+        """Queue many results: (seed, result) pairs or bare result dicts."""
+        for item in results:
+            if isinstance(item, dict):
+                self.add(item)
+            else:
+                self.add(item[1], item[0])
+        self.flush()
+
+    def flush(self):
+        """Write buffered battles in a single transaction; returns how many."""
+        if not self.pending:
+            return 0
+        pending, self.pending = self.pending, []
+        battles, champions, echoes = [], [], []
+        db = self.db
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            next_id = db.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM battles").fetchone()[0]
+            for battle_id, (seed, result) in enumerate(pending, next_id):
+                winner = result["winner"]
+                winner_side = SIDES.index(winner) if winner in SIDES else None
+                teams = ([], [])
+                for champ in result["champions"]:
+                    side = champ["side"]
+                    won = pw.side_score(winner, side)
+                    teams[side].append(champ["name"])
+                    casts = champ["echo_casts"]
+                    champions.append((
+                        battle_id, side, champ["slot"], champ["name"], champ["house"], won,
+                        champ["alive"], champ["damage_dealt"], champ["damage_taken"],
+                        champ["kos"], sum(casts.values()),
+                    ))
+                    for echo, count in casts.items():
+                        echoes.append((battle_id, side, champ["name"], echo, count, won))
+                battles.append((
+                    battle_id, seed, "/".join(teams[0]), "/".join(teams[1]), winner_side,
+                    result["rounds"], result.get("roster_version"), result.get("content_key"),
+                    pw.ENGINE_VERSION,
+                ))
+            db.executemany("INSERT INTO battles VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", battles)
+            db.executemany(
+                "INSERT INTO battle_champions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", champions
+            )
+            db.executemany("INSERT INTO battle_echoes VALUES (?, ?, ?, ?, ?, ?)", echoes)
+            db.execute("COMMIT")
+        except BaseException:
+            db.execute("ROLLBACK")
+            self.pending = pending + self.pending
+            raise
+        return len(battles)
+
+    def battle_count(self):
+        return self.db.execute("SELECT COUNT(*) FROM battles").fetchone()[0]
+
+    # ── Prebuilt queries ──
+    # Each returns rows of (name, battles, wins, win_rate), best first;
+    # draws count as half a win.
+
+    def win_rates_by_champion(self, min_battles=1):
+        return self.db.execute(
+            "SELECT champion, COUNT(*) AS n, SUM(won), AVG(won) AS rate"
+            " FROM battle_champions GROUP BY champion HAVING n >= ?"
+            " ORDER BY rate DESC, n DESC",
+            (min_battles,),
+        ).fetchall()
+
+    def win_rates_by_house(self, min_battles=1):
+        """A team fielding several champions of one house counts once."""
+        return self.db.execute(
+            "SELECT house, COUNT(*) AS n, SUM(won), AVG(won) AS rate FROM"
+            " (SELECT DISTINCT battle_id, side, house, won FROM battle_champions)"
+            " GROUP BY house HAVING n >= ? ORDER BY rate DESC, n DESC",
+            (min_battles,),
+        ).fetchall()
+
+    def win_rates_by_echo(self, min_battles=1):
+        """Win rate of the caster's team in battles where the echo was cast."""
+        return self.db.execute(
+            "SELECT echo, COUNT(*) AS n, SUM(won), AVG(won) AS rate"
+            " FROM battle_echoes GROUP BY echo HAVING n >= ?"
+            " ORDER BY rate DESC, n DESC",
+            (min_battles,),
+        ).fetchall()
+
+    def close(self):
+        self.flush()
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+COLUMNS_PATH = os.path.join(pw.BASE_DIR, ".prism_cache", "columns")
+
+# name -> (array typecode for writing, NumPy dtype for reading, per slot?)
+RESULT_COLUMNS = {
+    "winner":       ("b", "i1", False),  # winning side, -1 for none
+    "rounds":       ("H", "u2", False),
+    "seed":         ("I", "u4", False),
+    "champion":     ("h", "i2", True),   # id in meta.json's champion table, -1 for an empty slot
+    "damage_dealt": ("i", "i4", True),
+    "damage_taken": ("i", "i4", True),
+    "kos":          ("B", "u1", True),
+    "echo_casts":   ("B", "u1", True),
+}
+
+
+class ResultColumns:
+    """Duel results as append-only, fixed-width columns on disk.
+
+    Each column is one raw file of native-endian values under
+    `directory`; per-champion columns hold `slots` values per battle
+    (side A's champions, then side B's, in slot order). meta.json records
+    the committed row count and is replaced only after the column files
+    are written, so a crashed append is simply ignored on the next open.
+    One writer per directory.
+
+    Champion ids are the directory's own: meta.json keeps the id -> name
+    table (new names are appended to it), so pack edits that add, drop
+    or reorder champions never shift ids already on disk. Directories
+    written before the table was recorded only open with `roster` set to
+    the snapshot their ids came from.
+
+    Appending needs only the standard library; reading (column(),
+    chunks(), summary()) needs NumPy and maps the files read-only.
+    """
+    def __init__(self, directory=None, slots=10, roster=None, batch_size=10000):
+        self.directory = directory or COLUMNS_PATH
+        self.batch_size = batch_size
+        os.makedirs(self.directory, exist_ok=True)
+        meta = self._read_meta()
+        self.slots = meta["slots"] if meta else slots
+        self.rows = meta["rows"] if meta else 0
+        if meta and "champions" in meta:
+            self.names = list(meta["champions"])
+            self.roster_version = meta.get("roster_version")
+        elif meta and self.rows and roster is None:
+            raise ValueError(
+                f"{self.directory} has no champion table; open it with roster= set to "
+                f"the snapshot its rows were written with"
+            )
+        else:
+            roster = roster or pw.ROSTER.snapshot()
+            self.names = [c["name"] for c in sorted(roster.champions, key=lambda c: c["id"])]
+            self.roster_version = roster.version
+        self.ids = {name: i for i, name in enumerate(self.names)}
+        for name in RESULT_COLUMNS:
+            # Drop bytes past the committed row count (an interrupted flush)
+            path = self._path(name)
+            committed = self.rows * self._row_bytes(name)
+            if not os.path.exists(path):
+                open(path, "wb").close()
+            elif os.path.getsize(path) > committed:
+                os.truncate(path, committed)
+        self.pending = {name: array.array(code) for name, (code, _, _) in RESULT_COLUMNS.items()}
+        self.pending_rows = 0
+        if not meta or "champions" not in meta:
+            self._write_meta()
+
+    def _path(self, name):
+        return os.path.join(self.directory, name + ".bin")
+
+    def _width(self, name):
+        return self.slots if RESULT_COLUMNS[name][2] else 1
+
+    def _row_bytes(self, name):
+        return self._width(name) * array.array(RESULT_COLUMNS[name][0]).itemsize
+
+    def _read_meta(self):
+        try:
+            with open(os.path.join(self.directory, "meta.json")) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def _write_meta(self):
+        path = os.path.join(self.directory, "meta.json")
+        with open(path + ".tmp", "w") as f:
+            json.dump({"rows": self.rows, "slots": self.slots,
+                       "columns": {name: spec[1] for name, spec in RESULT_COLUMNS.items()},
+                       "roster_version": self.roster_version, "champions": self.names}, f)
+        os.replace(path + ".tmp", path)
+
+    def __len__(self):
+        return self.rows
+
+    def add(self, result, seed=None):
+        """Queue one duel() result dict."""
+        # Place every champion before appending anything, so a rejected
+        # result leaves no half-written row behind
+        per_slot = [None] * self.slots
+        half = self.slots // 2
+        for champ in result["champions"]:
+            if champ["slot"] >= half:
+                raise ValueError(
+                    f"{champ['name']} sits in slot {champ['slot']}, but these columns "
+                    f"hold {half} champions per side (slots={self.slots})"
+                )
+            per_slot[champ["side"] * half + champ["slot"]] = champ
+
+        cols = self.pending
+        winner = result["winner"]
+        cols["winner"].append(SIDES.index(winner) if winner in SIDES else -1)
+        cols["rounds"].append(result["rounds"])
+        cols["seed"].append((seed or 0) & 0xFFFFFFFF)
+
+        ids = self.ids
+        for champ in per_slot:
+            if champ is None:
+                cols["champion"].append(-1)
+                for name in ("damage_dealt", "damage_taken", "kos", "echo_casts"):
+                    cols[name].append(0)
+                continue
+            champ_id = ids.get(champ["name"])
+            if champ_id is None:
+                # A champion added to the packs since the table was written
+                champ_id = ids[champ["name"]] = len(self.names)
+                self.names.append(champ["name"])
+            cols["champion"].append(champ_id)
+            cols["damage_dealt"].append(champ["damage_dealt"])
+            cols["damage_taken"].append(champ["damage_taken"])
+            cols["kos"].append(champ["kos"])
+            cols["echo_casts"].append(min(sum(champ["echo_casts"].values()), 255))
+
+        self.pending_rows += 1
+        if self.pending_rows >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Append queued rows to every column file; returns how many."""
+        if not self.pending_rows:
+            return 0
+        for name, values in self.pending.items():
+            with open(self._path(name), "ab") as f:
+                values.tofile(f)
+            del values[:]
+        flushed, self.pending_rows = self.pending_rows, 0
+        self.rows += flushed
+        self._write_meta()
+        return flushed
+
+    # ── Reading ──
+
+    def column(self, name):
+        """Read-only memmap of a column: shape (rows,) or (rows, slots)."""
+        import numpy as np
+
+        if not self.rows:
+            return np.zeros((0, self._width(name)) if RESULT_COLUMNS[name][2] else 0,
+                            dtype=RESULT_COLUMNS[name][1])
+        shape = (self.rows, self.slots) if RESULT_COLUMNS[name][2] else (self.rows,)
+        return np.memmap(self._path(name), dtype=RESULT_COLUMNS[name][1], mode="r", shape=shape)
+
+    def chunks(self, names, chunk_rows=1 << 22):
+        """Yield {name: array} windows of `chunk_rows` battles, so a
+        reduction over a billion rows touches one window at a time."""
+        columns = {name: self.column(name) for name in names}
+        for start in range(0, self.rows, chunk_rows):
+            yield {name: col[start:start + chunk_rows] for name, col in columns.items()}
+
+    def summary(self, chunk_rows=1 << 22):
+        """Side win rates, mean rounds and per-champion win rate / damage."""
+        import numpy as np
+
+        size = len(self.names)
+        wins = np.zeros(3, dtype=np.int64)  # side 0, side 1, none
+        rounds = 0
+        games = np.zeros(size, dtype=np.int64)
+        champ_wins = np.zeros(size)  # draws count half
+        damage = np.zeros(size, dtype=np.int64)
+        half = self.slots // 2
+        side_of_slot = np.repeat(np.arange(2), half)
+
+        for chunk in self.chunks(("winner", "rounds", "champion", "damage_dealt"), chunk_rows):
+            winner = chunk["winner"]
+            wins += np.bincount(np.where(winner < 0, 2, winner), minlength=3)
+            rounds += int(chunk["rounds"].sum(dtype=np.int64))
+            ids = chunk["champion"]
+            filled = ids >= 0
+            won = winner[:, None] == side_of_slot[None, :]
+            drawn = np.broadcast_to(winner[:, None] < 0, won.shape)
+            games += np.bincount(ids[filled], minlength=size)
+            champ_wins += np.bincount(ids[filled & won], minlength=size)
+            champ_wins += 0.5 * np.bincount(ids[filled & drawn], minlength=size)
+            damage += np.bincount(ids[filled], weights=chunk["damage_dealt"][filled],
+                                  minlength=size).astype(np.int64)
+
+        total = max(self.rows, 1)
+        champions = {}
+        for champ_id, name in enumerate(self.names):
+            n = int(games[champ_id])
+            if n:
+                champions[name] = {
+                    "battles": n,
+                    "win_rate": champ_wins[champ_id] / n,
+                    "avg_damage": damage[champ_id] / n,
+                }
+        return {
+            "battles": self.rows,
+            "win_rate": {SIDES[0]: wins[0] / total, SIDES[1]: wins[1] / total, None: wins[2] / total},
+            "avg_rounds": rounds / total,
+            "champions": champions,
+        }
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
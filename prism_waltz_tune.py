@@ -0,0 +1,391 @@
+"""Automated balance tuning for Dreamer Waltz.
+
+BalanceTuner searches house bonus numbers (HOUSE_ECHO_BONUSES) and,
+optionally, selected echoes' stat_modifiers / ep_cost for values that
+bring every house-vs-house win rate close to 50%. Candidates are roster
+variants (RosterSnapshot.with_changes) simulated on a SimPool; within a
+generation every candidate fights the same battles with the same seeds
+(common random numbers), so candidates are ranked on their differences,
+not on dice.
+
+Run `python prism_waltz_tune.py --generations 20 --battles 40` for a
+search over all house bonuses; pass `--echo TITLE` (repeatable) to tune
+echoes too.
+
+sensitivity() ranks the engine's combat constants (Ruleset fields)
+by how much nudging each one moves house win-rate spread and battle
+length: `python prism_waltz_tune.py --sensitivity --delta 0.2`.
+"""
+import math
+import random
+import sys
+
+import prism_waltz_tr as pw
+import prism_waltz_sim as sim
+
+# Per-parameter search scale (one step of the search ≈ one scale unit) and bounds
+BONUS_SCALE = {"CRIT": 3, "HP": 10, "EP": 5, "EP_ON_HIT": 3, "EP_ON_KO_RECEIVED": 5}
+BONUS_DEFAULT_SCALE = 2
+EP_COST_SCALE = 10
+
+
+def balance_parameters(roster, echoes=()):
+    """Tunable numbers as dicts (kind, name, key, base, low, high, scale).
+    House bonuses: every numeric entry (flags like RANDOM_BUFF stay put).
+    Echoes: ep_cost and each non-zero stat_modifier of the given titles."""
+    params = []
+    for house, bonuses in roster.house_bonuses.items():
+        for key, value in bonuses.items():
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                continue
+            params.append({
+                "kind": "house", "name": house, "key": key, "base": value,
+                "low": min(value, 0), "high": None,
+                "scale": BONUS_SCALE.get(key, BONUS_DEFAULT_SCALE),
+            })
+    for title in echoes:
+        echo = next(e for e in roster.echo_titles if e["title"] == title)
+        params.append({
+            "kind": "echo", "name": title, "key": "ep_cost", "base": echo["ep_cost"],
+            "low": 0, "high": 100, "scale": EP_COST_SCALE,
+        })
+        for key, value in echo["stat_modifiers"].items():
+            if value:
+                params.append({
+                    "kind": "echo", "name": title, "key": key, "base": value,
+                    "low": 0, "high": None, "scale": max(abs(value) // 4, 2),
+                })
+    return params
+
+
+def parameter_values(params, x):
+    """Integer parameter values for a point `x` of the normalized search
+    space (0 is the current roster)."""
+    values = []
+    for p, xi in zip(params, x):
+        value = round(p["base"] + xi * p["scale"])
+        if p["low"] is not None:
+            value = max(value, p["low"])
+        if p["high"] is not None:
+            value = min(value, p["high"])
+        values.append(value)
+    return values
+
+
+def roster_overrides(roster, params, values):
+    """RosterSnapshot.with_changes() arguments setting params to values."""
+    house_bonuses, echoes = {}, {}
+    for p, value in zip(params, values):
+        if p["kind"] == "house":
+            bonuses = house_bonuses.setdefault(p["name"], dict(roster.house_bonuses[p["name"]]))
+            bonuses[p["key"]] = value
+        else:
+            echo = echoes.setdefault(p["name"], {})
+            if p["key"] == "ep_cost":
+                echo["ep_cost"] = value
+            else:
+                if "stat_modifiers" not in echo:
+                    base = next(e for e in roster.echo_titles if e["title"] == p["name"])
+                    echo["stat_modifiers"] = dict(base["stat_modifiers"])
+                echo["stat_modifiers"][p["key"]] = value
+    return {"house_bonuses": house_bonuses, "echoes": echoes}
+
+
+def house_battles(roster, battles_per_pair, seed, team_size=5):
+    """Battles for every ordered pair of houses: random single-house
+    teams, drawn reproducibly from `seed`. Returns (battles, pairs), with
+    pairs[i] the (house A, house B) of battles[i]."""
+    rng = random.Random(seed)
+    names = {h: [c["name"] for c in recs] for h, recs in roster.houses.items()}
+    battles, pairs = [], []
+    for house_a in names:
+        for house_b in names:
+            if house_a == house_b:
+                continue
+            for _ in range(battles_per_pair):
+                battles.append((
+                    tuple(rng.sample(names[house_a], team_size)),
+                    tuple(rng.sample(names[house_b], team_size)),
+                    rng.getrandbits(32),
+                ))
+                pairs.append((house_a, house_b))
+    return battles, pairs
+
+
+def house_win_rates(results, pairs):
+    """{(house A, house B): A's win rate}, A fighting as the Dreamers;
+    draws count half."""
+    wins, counts = {}, {}
+    for result, pair in zip(results, pairs):
+        counts[pair] = counts.get(pair, 0) + 1
+        wins[pair] = wins.get(pair, 0) + sim.score(result)
+    return {pair: wins[pair] / counts[pair] for pair in counts}
+
+
+def balance_loss(rates):
+    """Mean squared distance of house-vs-house win rates from 50%. Both
+    seatings of a pair are averaged first, so the Dreamers' first-move
+    edge isn't charged to the houses."""
+    seen, total = set(), 0.0
+    for (a, b), rate in rates.items():
+        if (b, a) in seen:
+            continue
+        seen.add((a, b))
+        mirrored = rates.get((b, a))
+        rate = rate if mirrored is None else (rate + 1 - mirrored) / 2
+        total += (rate - 0.5) ** 2
+    return total / max(len(seen), 1)
+
+
+def roster_pool(roster, pool=None):
+    """`pool`, or a new SimPool, whose workers simulate on `roster`. A
+    pool built on a different roster would quietly run the wrong one, so
+    that is refused."""
+    if pool is None:
+        return sim.SimPool(roster=roster)
+    base = pool.roster or pw.ROSTER.snapshot()
+    if base.version != roster.version:
+        raise ValueError(
+            f"pool simulates roster {base.version}, not {roster.version}; "
+            "build it with SimPool(roster=...)"
+        )
+    return pool
+
+
+class BalanceTuner:
+    """Separable CMA-ES (diagonal covariance) over balance_parameters().
+
+    Plain Python rather than NumPy: the search space is a few dozen
+    numbers and every step costs thousands of duels, so the optimizer's
+    own arithmetic is noise. Each generation draws fresh battles and
+    evaluates all candidates on them through the pool.
+    """
+    def __init__(self, roster=None, echoes=(), pool=None, battles_per_pair=20,
+                 sigma=1.0, population=None, seed=0):
+        self.roster = roster or pw.ROSTER.snapshot()
+        self.params = balance_parameters(self.roster, echoes)
+        self.pool = roster_pool(self.roster, pool)
+        self.battles_per_pair = battles_per_pair
+        self.rng = random.Random(seed)
+        self.seed = seed
+
+        n = self.n = len(self.params)
+        self.lam = population or 4 + int(3 * math.log(n))
+        self.mu = self.lam // 2
+        weights = [math.log(self.mu + 0.5) - math.log(i + 1) for i in range(self.mu)]
+        total = sum(weights)
+        self.weights = [w / total for w in weights]
+        self.mueff = 1 / sum(w * w for w in self.weights)
+        mueff = self.mueff
+
+        self.cs = (mueff + 2) / (n + mueff + 5)
+        self.ds = 1 + 2 * max(0.0, math.sqrt((mueff - 1) / (n + 1)) - 1) + self.cs
+        self.cc = (4 + mueff / n) / (n + 4 + 2 * mueff / n)
+        # Diagonal-only learning rates, scaled up by (n + 2) / 3 (Ros & Hansen)
+        self.c1 = min(1.0, (n + 2) / 3 * 2 / ((n + 1.3) ** 2 + mueff))
+        self.cmu = min(1 - self.c1, (n + 2) / 3 * 2 * (mueff - 2 + 1 / mueff) / ((n + 2) ** 2 + mueff))
+        self.chi_n = math.sqrt(n) * (1 - 1 / (4 * n) + 1 / (21 * n * n))
+
+        self.mean = [0.0] * n
+        self.sigma = sigma
+        self.diag = [1.0] * n  # covariance diagonal
+        self.ps = [0.0] * n
+        self.pc = [0.0] * n
+        self.generation = 0
+        self.best = None  # (loss, values, rates)
+        self.history = []  # (generation, best loss this generation, sigma)
+
+    def evaluate(self, points, generation_seed):
+        """Loss and win rates per point, all points on the same battles."""
+        battles, pairs = house_battles(self.roster, self.battles_per_pair, generation_seed)
+        values = [parameter_values(self.params, x) for x in points]
+        jobs = [(roster_overrides(self.roster, self.params, v), battles) for v in values]
+        scored = []
+        for v, results in zip(values, self.pool.run(jobs)):
+            rates = house_win_rates(results, pairs)
+            scored.append((balance_loss(rates), v, rates))
+        return scored
+
+    def step(self):
+        """One generation: sample, evaluate, update. Returns its best loss."""
+        n, sigma = self.n, self.sigma
+        zs = [[self.rng.gauss(0, 1) for _ in range(n)] for _ in range(self.lam)]
+        ys = [[math.sqrt(d) * z for d, z in zip(self.diag, zk)] for zk in zs]
+        points = [[m + sigma * y for m, y in zip(self.mean, yk)] for yk in ys]
+
+        scored = self.evaluate(points, self.rng.getrandbits(32))
+        order = sorted(range(self.lam), key=lambda k: scored[k][0])
+        if self.best is None or scored[order[0]][0] < self.best[0]:
+            self.best = scored[order[0]]
+
+        chosen = order[:self.mu]
+        y_w = [sum(w * ys[k][i] for w, k in zip(self.weights, chosen)) for i in range(n)]
+        z_w = [sum(w * zs[k][i] for w, k in zip(self.weights, chosen)) for i in range(n)]
+        self.mean = [m + sigma * y for m, y in zip(self.mean, y_w)]
+
+        cs, cc, c1, cmu = self.cs, self.cc, self.c1, self.cmu
+        self.ps = [(1 - cs) * p + math.sqrt(cs * (2 - cs) * self.mueff) * z for p, z in zip(self.ps, z_w)]
+        ps_norm = math.sqrt(sum(p * p for p in self.ps))
+        self.generation += 1
+        hsig = ps_norm / math.sqrt(1 - (1 - cs) ** (2 * self.generation)) / self.chi_n < 1.4 + 2 / (n + 1)
+        self.pc = [(1 - cc) * p + hsig * math.sqrt(cc * (2 - cc) * self.mueff) * y for p, y in zip(self.pc, y_w)]
+        for i in range(n):
+            rank_mu = sum(w * ys[k][i] ** 2 for w, k in zip(self.weights, chosen))
+            self.diag[i] = (
+                (1 - c1 - cmu) * self.diag[i]
+                + c1 * (self.pc[i] ** 2 + (not hsig) * cc * (2 - cc) * self.diag[i])
+                + cmu * rank_mu
+            )
+        self.sigma *= math.exp(cs / self.ds * (ps_norm / self.chi_n - 1))
+
+        best_loss = scored[order[0]][0]
+        self.history.append((self.generation, best_loss, self.sigma))
+        return best_loss
+
+    def run(self, generations=10, callback=None):
+        for _ in range(generations):
+            loss = self.step()
+            if callback is not None:
+                callback(self, loss)
+        return self.best
+
+    def baseline(self):
+        """Loss of the untouched roster on a fresh battle set."""
+        return self.evaluate([[0.0] * self.n], self.rng.getrandbits(32))[0][0]
+
+    def recommended(self):
+        """Parameter values at the search mean. With noisy losses this is a
+        steadier pick than the single best-scoring candidate."""
+        return parameter_values(self.params, self.mean)
+
+    def changes(self, values=None):
+        """[(kind, name, key, old, new)] for parameters that moved, at the
+        recommended values unless `values` are given."""
+        values = values if values is not None else self.recommended()
+        return [
+            (p["kind"], p["name"], p["key"], p["base"], v)
+            for p, v in zip(self.params, values) if v != p["base"]
+        ]
+
+
+# --- Sensitivity analysis ---
+ENGINE_CONSTANTS = (
+    "hp_bonus", "base_ep_per_turn", "ep_cap", "low_hp_threshold",
+    "aoe_multiplier", "burst_multiplier", "lifesteal_ratio",
+)
+
+
+def perturbed(value, delta):
+    """`value` scaled by (1 + delta); integer constants stay integers."""
+    scaled = value * (1 + delta)
+    return round(scaled) if isinstance(value, int) else scaled
+
+
+def house_spread(results, pairs):
+    """(Std dev of the houses' overall win rates, mean battle length).
+    A perfectly balanced roster has a spread near 0."""
+    wins, counts, rounds = {}, {}, 0
+    for result, (house_a, house_b) in zip(results, pairs):
+        a_won = sim.score(result, 0)
+        for house, won in ((house_a, a_won), (house_b, 1 - a_won)):
+            counts[house] = counts.get(house, 0) + 1
+            wins[house] = wins.get(house, 0) + won
+        rounds += result["rounds"]
+    rates = [wins[h] / counts[h] for h in counts]
+    mean = sum(rates) / len(rates)
+    spread = math.sqrt(sum((r - mean) ** 2 for r in rates) / len(rates))
+    return spread, rounds / max(len(results), 1)
+
+
+def battle_play(result):
+    """How a battle went, without the labels (ruleset digest, roster
+    version) that differ between variants anyway."""
+    return result["winner"], result["rounds"], result["end"], result["champions"]
+
+
+def sensitivity(pool=None, roster=None, constants=ENGINE_CONSTANTS, deltas=(-0.2, 0.2),
+                battles_per_pair=10, seed=0, rules=None):
+    """Perturb each Ruleset field in `constants` by each relative delta
+    and measure house win-rate spread and battle length against `rules`
+    (default: pw.DEFAULT_RULES), all variants on the same seeded
+    house-vs-house battles.
+
+    Returns rows sorted by `impact`, the larger of the relative changes
+    in spread and in battle length over the deltas tried. `changed` is
+    the largest share of battles that played out differently at all: an
+    impact of 0 with changed == 0 means the constant was never read in
+    these battles, not that it doesn't matter.
+    """
+    roster = roster or pw.ROSTER.snapshot()
+    pool = roster_pool(roster, pool)
+    rules = rules or pw.DEFAULT_RULES
+    battles, pairs = house_battles(roster, battles_per_pair, seed)
+    variants = [(name, perturbed(getattr(rules, name), delta)) for name in constants for delta in deltas]
+    base = rules._asdict()
+    jobs = [({"rules": base}, battles)]
+    jobs += [({"rules": dict(base, **{name: value})}, battles) for name, value in variants]
+    runs = pool.run(jobs)
+    outcomes = [house_spread(results, pairs) for results in runs]
+    base_spread, base_rounds = outcomes[0]
+
+    rows = {}
+    for (name, value), (spread, rounds), results in zip(variants, outcomes[1:], runs[1:]):
+        row = rows.setdefault(name, {
+            "constant": name, "value": getattr(rules, name), "variants": [],
+            "impact": 0.0, "changed": 0.0,
+        })
+        changed = sum(
+            battle_play(a) != battle_play(b) for a, b in zip(results, runs[0])
+        ) / max(len(results), 1)
+        spread_change = (spread - base_spread) / max(base_spread, 1e-9)
+        rounds_change = (rounds - base_rounds) / max(base_rounds, 1e-9)
+        row["variants"].append({
+            "value": value, "spread": spread, "rounds": rounds,
+            "spread_change": spread_change, "rounds_change": rounds_change,
+            "changed": changed,
+        })
+        row["impact"] = max(row["impact"], abs(spread_change), abs(rounds_change))
+        row["changed"] = max(row["changed"], changed)
+    ranked = sorted(rows.values(), key=lambda row: row["impact"], reverse=True)
+    return {"spread": base_spread, "rounds": base_rounds, "constants": ranked}
+
+
+def main(argv=None):
+    argv = list(sys.argv[1:] if argv is None else argv)
+
+    def option(flag, default, cast=int):
+        if flag in argv:
+            return cast(argv[argv.index(flag) + 1])
+        return default
+
+    echoes = [argv[i + 1] for i, arg in enumerate(argv) if arg == "--echo"]
+    with sim.SimPool(option("--workers", None)) as pool:
+        if "--sensitivity" in argv:
+            delta = option("--delta", 0.2, float)
+            report = sensitivity(pool, deltas=(-delta, delta),
+                                 battles_per_pair=option("--battles", 10), seed=option("--seed", 0))
+            print(f"📐 Baseline: win-rate spread {report['spread']:.4f}, {report['rounds']:.2f} rounds")
+            for row in report["constants"]:
+                moves = ", ".join(
+                    f"{v['value']:g} → spread {v['spread_change']:+.1%} rounds {v['rounds_change']:+.1%}"
+                    for v in row["variants"]
+                )
+                print(f"   {row['constant']:<17} {row['impact']:>7.1%}  ({moves})")
+                if not row["changed"]:
+                    print(f"   {'':<17} {'':>7}  no battle changed: not read in these battles")
+            return
+        tuner = BalanceTuner(
+            echoes=echoes, pool=pool, battles_per_pair=option("--battles", 20),
+            seed=option("--seed", 0),
+        )
+        print(f"🎛️ Tuning {tuner.n} parameters, {tuner.lam} candidates per generation")
+        print(f"   baseline loss {tuner.baseline():.5f}")
+        tuner.run(option("--generations", 10), lambda t, loss: print(
+            f"   generation {t.generation:>3}: best {loss:.5f} (sigma {t.sigma:.3f})"))
+        print(f"\n🏁 Best candidate loss {tuner.best[0]:.5f}; recommended changes:")
+        for kind, name, key, old, new in tuner.changes():
+            print(f"   {kind:<5} {name} {key}: {old} → {new}")
+
+
+if __name__ == "__main__":
+    main()